@@ -257,26 +257,94 @@ feat(risk-prediction): Implement AI risk prediction models
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
 import numpy as np
+import copy
+from typing import Dict
+import threading
+import time
 
 class AIRiskPredictor:
-    def __init__(self):
+    def __init__(self, max_trees: int = 100):
         self.model = RandomForestClassifier(n_estimators=100)
         self.scaler = StandardScaler()
         self.risk_categories = ['LOW', 'MEDIUM', 'HIGH']
+        self.max_trees = max_trees  # forest size cap for incremental updates
+        self.result_cache = None  # optional TransactionResultCache cleared on model swap
+        # (scaler, model) pair served to predict_risk; replaced as a whole on retrain
+        self._serving = (self.scaler, self.model)
+        self._update_lock = threading.Lock()
 
     def preprocess_data(self, data):
         """Preprocess financial data for risk prediction"""
-        return self.scaler.fit_transform(data)
+        # Never refit here: the scaler is shared with live predict_risk callers
+        return self._serving[0].transform(data)
+
+    def _swap_model(self, scaler, model):
+        """Atomically publish a refreshed scaler/model pair to predict_risk callers"""
+        self._serving = (scaler, model)
+        self.scaler, self.model = scaler, model
+        if self.result_cache is not None:
+            # Cached scores came from the previous model
+            self.result_cache.clear()
+
+    def publish_model(self, scaler, model):
+        """Swap in an externally trained scaler/model pair, serialized with updates"""
+        with self._update_lock:
+            self._swap_model(scaler, model)
 
     def train_model(self, X_train, y_train):
         """Train the risk prediction model"""
-        X_scaled = self.preprocess_data(X_train)
-        self.model.fit(X_scaled, y_train)
+        with self._update_lock:
+            scaler = StandardScaler()
+            model = RandomForestClassifier(n_estimators=100)
+            model.fit(scaler.fit_transform(X_train), y_train)
+            self._swap_model(scaler, model)
+
+    def update_model(self, X_new, y_new, n_new_trees: int = 10, replace_oldest: bool = True) -> Dict:
+        """
+        Incrementally update the model with newly labeled data
+
+        Grows the forest by n_new_trees fitted on the new data (warm_start) and,
+        when replace_oldest is set, drops the oldest trees beyond max_trees. The
+        live model is never modified; the refreshed copy is swapped in once
+        fitting is done.
+
+        The scaler is kept fixed: retained trees learned their split thresholds
+        in its scaled space, and updating it would shift their inputs. Forests
+        do not depend on feature scale, so new trees are fitted in the same
+        space. A full train_model refits the scaler.
+        """
+        start = time.perf_counter()
+        with self._update_lock:
+            scaler, model = self._serving
+            if not hasattr(model, 'estimators_'):
+                raise ValueError('train_model must be called before update_model')
+            if not np.array_equal(np.unique(y_new), model.classes_):
+                raise ValueError(f'Update data must contain all classes {model.classes_.tolist()}')
+
+            # Shallow copy shares the fitted trees; only the tree list is duplicated
+            new_model = copy.copy(model)
+            new_model.estimators_ = list(model.estimators_)
+            new_model.set_params(warm_start=True,
+                                 n_estimators=len(new_model.estimators_) + n_new_trees)
+            new_model.fit(scaler.transform(X_new), y_new)
+
+            if replace_oldest and len(new_model.estimators_) > self.max_trees:
+                new_model.estimators_ = new_model.estimators_[-self.max_trees:]
+                new_model.n_estimators = self.max_trees
+
+            self._swap_model(scaler, new_model)
+
+        return {
+            'trees_added': n_new_trees,
+            'total_trees': len(new_model.estimators_),
+            'refit_seconds': time.perf_counter() - start
+        }
 
     def predict_risk(self, features):
         """Predict risk levels for new data"""
-        X_scaled = self.preprocess_data(features)
-        predictions = self.model.predict_proba(X_scaled)
+        scaler, model = self._serving
+        X_scaled = scaler.transform(features)
+        predictions = model.predict_proba(X_scaled)
         return predictions
 
     def calculate_risk_metrics(self, predictions):
@@ -288,6 +356,37 @@ class AIRiskPredictor:
         }
         return risk_scores
 
+def benchmark_incremental_training(n_samples: int = 200_000,
+                                   n_features: int = 20,
+                                   update_fraction: float = 0.05,
+                                   n_new_trees: int = 10) -> Dict:
+    """Compare an incremental update against a full retrain on synthetic data"""
+    from sklearn.datasets import make_classification
+
+    n_update = int(n_samples * update_fraction)
+    X, y = make_classification(n_samples=n_samples + n_update, n_features=n_features,
+                               n_informative=n_features // 2, n_classes=3, random_state=0)
+    X_base, y_base = X[:n_samples], y[:n_samples]
+    X_new, y_new = X[n_samples:], y[n_samples:]
+
+    predictor = AIRiskPredictor()
+    start = time.perf_counter()
+    predictor.train_model(X_base, y_base)
+    initial_train_seconds = time.perf_counter() - start
+
+    update = predictor.update_model(X_new, y_new, n_new_trees=n_new_trees)
+
+    start = time.perf_counter()
+    AIRiskPredictor().train_model(X, y)
+    full_retrain_seconds = time.perf_counter() - start
+
+    return {
+        'initial_train_seconds': initial_train_seconds,
+        'incremental_update_seconds': update['refit_seconds'],
+        'full_retrain_seconds': full_retrain_seconds,
+        'speedup': full_retrain_seconds / update['refit_seconds']
+    }
+
 """## No. 5
 ### Blockchain Transaction Monitoring System
 feat(blockchain): Add blockchain transaction monitoring
@@ -301,8 +400,20 @@ from datetime import datetime
 import hashlib
 import json
 
+def canonical_transaction_hash(transaction):
+    """SHA-256 of the key-sorted JSON form of a transaction"""
+    return hashlib.sha256(
+        json.dumps(transaction, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
 class BlockchainMonitor:
-    def __init__(self):
+    def __init__(self, audit_log=None, result_cache=None,
+                 currency_limits=None, counterparty_limits=None):
+        self.audit_log = audit_log  # optional AuditLog for persisting results
+        self.result_cache = result_cache  # optional TransactionResultCache for replays
+        self.alert_engine = None    # BatchAlertEngine, created on first batch
+        self.currency_limits = currency_limits or {}  # max value per currency
+        self.counterparty_limits = counterparty_limits or {}  # max value per sender/receiver
         self.transaction_pool = []
         self.verified_transactions = []
         self.alert_thresholds = {
@@ -312,17 +423,30 @@ class BlockchainMonitor:
 
     def monitor_transaction(self, transaction):
         """Monitor individual blockchain transactions"""
-        transaction_hash = hashlib.sha256(
-            json.dumps(transaction, sort_keys=True).encode()
-        ).hexdigest()
+        transaction_hash = canonical_transaction_hash(transaction)
+
+        # Retried or replayed payloads hash the same and skip rescoring
+        scored = None
+        if self.result_cache is not None:
+            scored = self.result_cache.get(transaction_hash, scope='blockchain')
+        if scored is None:
+            scored = {
+                'risk_level': self.assess_transaction_risk(transaction),
+                'alerts': self.generate_alerts(transaction)
+            }
+            if self.result_cache is not None:
+                self.result_cache.put(transaction_hash, scored, scope='blockchain')
 
         monitoring_result = {
             'timestamp': datetime.now(),
             'transaction_hash': transaction_hash,
-            'risk_level': self.assess_transaction_risk(transaction),
-            'alerts': self.generate_alerts(transaction)
+            'risk_level': scored['risk_level'],
+            'alerts': list(scored['alerts'])
         }
 
+        if self.audit_log is not None:
+            self.audit_log.append(monitoring_result)
+
         return monitoring_result
 
     def assess_transaction_risk(self, transaction):
@@ -340,8 +464,18 @@ class BlockchainMonitor:
         alerts = []
         if transaction['value'] > self.alert_thresholds['high_value_threshold']:
             alerts.append('HIGH_VALUE_TRANSACTION')
+        if transaction.get('pattern_score', 0) >= self.alert_thresholds['suspicious_pattern_threshold']:
+            alerts.append('SUSPICIOUS_PATTERN')
         return alerts
 
+    def generate_batch_alerts(self, transactions):
+        """Generate alerts for a columnar batch of transactions"""
+        if self.alert_engine is None:
+            self.alert_engine = BatchAlertEngine(self.alert_thresholds,
+                                                 currency_limits=self.currency_limits,
+                                                 counterparty_limits=self.counterparty_limits)
+        return self.alert_engine.evaluate(transactions)
+
 """# No 6
 ### Cost-Benefit Analysis Calculator
 feat(analysis): Implement cost-benefit analysis calculator
@@ -449,7 +583,8 @@ class BaselIVMetrics:
     risk_weighted_assets: float
 
 class GlobalComplianceMonitor:
-    def __init__(self):
+    def __init__(self, audit_log=None):
+        self.audit_log = audit_log  # optional AuditLog for persisting results
         self.basel_iv_requirements = {
             'minimum_tier1_ratio': 0.06,
             'minimum_total_capital': 0.08,
@@ -511,13 +646,18 @@ class GlobalComplianceMonitor:
         """
         Real-time compliance monitoring for transactions
         """
-        return {
+        monitoring_result = {
             'timestamp': datetime.now(),
             'transaction_id': transaction_data.get('id'),
             'compliance_status': self.check_transaction_compliance(transaction_data),
             'risk_level': self.assess_transaction_risk(transaction_data)
         }
 
+        if self.audit_log is not None:
+            self.audit_log.append(monitoring_result)
+
+        return monitoring_result
+
 """#### Real-time Data Processing System
 feat(real-time): Implement real-time data processing system with streaming capabilities
 - Adds real-time transaction processing
@@ -582,6 +722,7 @@ feat(integration): Add banking system integration with REST API endpoints
 !pip install fastapi uvicorn
 
 from fastapi import FastAPI, HTTPException, Security
+from fastapi.encoders import jsonable_encoder
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel
 import uvicorn
@@ -611,12 +752,19 @@ async def assess_transaction_risk(
     Endpoint for real-time transaction risk assessment
     """
     try:
+        transaction_hash = canonical_transaction_hash(jsonable_encoder(transaction))
+        cached = risk_result_cache.get(transaction_hash, scope='risk-assessment')
+        if cached is not None:
+            return cached
+
         risk_score = await risk_analyzer.analyze_transaction(transaction)
-        return RiskAssessment(
+        assessment = RiskAssessment(
             risk_score=risk_score,
             risk_factors=risk_analyzer.identify_risk_factors(transaction),
             compliance_status="COMPLIANT" if risk_score < 0.7 else "HIGH_RISK"
         )
+        risk_result_cache.put(transaction_hash, assessment, scope='risk-assessment')
+        return assessment
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -715,6 +863,952 @@ class PerformanceMonitor:
             'recommendations': self.generate_recommendations(metrics)
         }
 
+"""### Persistent Audit Trail
+feat(audit): Add append-only audit log for monitoring results
+- Implements segment-based append-only storage with compact binary records
+- Adds group-commit fsync batching for write throughput
+- Includes SHA-256 hash chaining for tamper evidence
+- Adds transaction hash, id and time range indexes
+"""
+
+import os
+import bisect
+import struct
+import threading
+import time
+import zlib
+from typing import Iterator, Tuple
+import numpy as np
+
+class AuditLog:
+    # payload_len, sequence, timestamp (us), previous hash, transaction hash, id length
+    RECORD_FIELDS = struct.Struct('>IQq32s32sH')
+    HEADER_SIZE = RECORD_FIELDS.size + 4  # fields followed by their CRC-32
+    DIGEST_SIZE = 32
+    GENESIS_HASH = b'\x00' * 32
+    # On-disk index of a sealed segment
+    TIME_DTYPE = np.dtype([('ts', '<i8'), ('offset', '<u8')])
+    KEY_DTYPE = np.dtype([('key', 'S16'), ('offset', '<u8')])
+    BLOOM_BITS_PER_KEY = 10
+    BLOOM_HASHES = 7
+
+    def __init__(self,
+                 directory: str,
+                 segment_size: int = 64 * 1024 * 1024,
+                 group_commit_size: int = 256,
+                 group_commit_interval: float = 0.05):
+        """
+        Open (or create) an audit log stored in `directory`
+
+        Sealed segments keep their indexes on disk; only per-segment metadata
+        and the index of the active segment are held in memory. Reopening
+        verifies the hash chain of the active segment and raises ValueError on
+        corruption instead of discarding records.
+
+        Parameters:
+        segment_size: Size in bytes after which the active segment is sealed
+        group_commit_size: Number of appends batched into one fsync
+        group_commit_interval: Maximum seconds an appended record waits for its fsync
+        """
+        self.directory = directory
+        self.segment_size = segment_size
+        self.group_commit_size = group_commit_size
+        self.group_commit_interval = group_commit_interval
+
+        self._lock = threading.RLock()
+        self._sealed: List[Dict] = []  # metadata of sealed segments, in order
+        self._blooms: Dict[int, np.ndarray] = {}  # loaded on first point lookup
+        self._active_segment = 0
+        self._active_size = 0
+        self._active_keys: Dict[bytes, List[int]] = {}
+        self._active_times: List[Tuple[int, int]] = []  # (ts_us, offset)
+        self._last_hash = self.GENESIS_HASH
+        self._next_seq = 0
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._commit_timer: Optional[threading.Timer] = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f'segment-{segment:08d}.log')
+
+    def _index_path(self, segment: int, part: str) -> str:
+        return os.path.join(self.directory, f'segment-{segment:08d}.{part}')
+
+    @staticmethod
+    def _json_default(value):
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if hasattr(value, 'tolist'):  # numpy scalars and arrays
+            return value.tolist()
+        return str(value)
+
+    @staticmethod
+    def _to_micros(value) -> int:
+        if value is None:
+            value = datetime.now()
+        return round(value.timestamp() * 1_000_000)
+
+    @staticmethod
+    def _from_micros(ts_us: int) -> datetime:
+        return datetime.fromtimestamp(ts_us // 1_000_000).replace(microsecond=ts_us % 1_000_000)
+
+    @staticmethod
+    def _lookup_key(kind: bytes, value: str) -> bytes:
+        """Fixed-size index key for a transaction hash (b'h') or id (b'i')"""
+        return hashlib.sha256(kind + value.encode()).digest()[:16]
+
+    def _encode(self, record: Dict, seq: int) -> Tuple[bytes, int, List[bytes]]:
+        """Encode a result dict as a hash-chained binary record"""
+        payload = dict(record)
+        ts_us = self._to_micros(payload.pop('timestamp', None))
+        keys = []
+
+        tx_hash = payload.get('transaction_hash')
+        tx_hash_raw = self.GENESIS_HASH
+        if isinstance(tx_hash, str) and len(tx_hash) == 64:
+            try:
+                tx_hash_raw = bytes.fromhex(tx_hash)
+                del payload['transaction_hash']
+                keys.append(self._lookup_key(b'h', tx_hash_raw.hex()))
+            except ValueError:
+                pass
+
+        record_id = record.get('transaction_id', record.get('id'))
+        id_raw = str(record_id).encode() if record_id is not None else b''
+        if record_id is not None:
+            keys.append(self._lookup_key(b'i', str(record_id)))
+
+        payload_raw = json.dumps(payload, separators=(',', ':'),
+                                 default=self._json_default).encode()
+        fields = self.RECORD_FIELDS.pack(len(payload_raw), seq, ts_us, self._last_hash,
+                                         tx_hash_raw, len(id_raw))
+        body = fields + struct.pack('>I', zlib.crc32(fields)) + id_raw + payload_raw
+        record_hash = hashlib.sha256(body).digest()
+        return body + record_hash, ts_us, keys
+
+    def _decode(self, body: bytes) -> Dict:
+        payload_len, seq, ts_us, _, tx_hash_raw, id_len = self.RECORD_FIELDS.unpack_from(body)
+        start = self.HEADER_SIZE + id_len
+        record = json.loads(body[start:start + payload_len])
+        record['timestamp'] = self._from_micros(ts_us)
+        if tx_hash_raw != self.GENESIS_HASH:
+            record['transaction_hash'] = tx_hash_raw.hex()
+        record['audit_sequence'] = seq
+        return record
+
+    def _scan_segment(self, segment: int) -> Iterator[Tuple[int, bytes, bytes]]:
+        """
+        Yield (offset, body, stored_hash) for every complete record in a segment
+
+        Stops at a final record cut short by EOF (a torn write); raises
+        ValueError on a header whose checksum does not match.
+        """
+        with open(self._segment_path(segment), 'rb') as handle:
+            offset = 0
+            while True:
+                header = handle.read(self.HEADER_SIZE)
+                if len(header) < self.HEADER_SIZE:
+                    return
+                fields = header[:self.RECORD_FIELDS.size]
+                if struct.unpack('>I', header[self.RECORD_FIELDS.size:])[0] != zlib.crc32(fields):
+                    raise ValueError(f'Corrupt record header in audit segment {segment} at offset {offset}')
+                payload_len, _, _, _, _, id_len = self.RECORD_FIELDS.unpack(fields)
+                rest = handle.read(id_len + payload_len + self.DIGEST_SIZE)
+                if len(rest) < id_len + payload_len + self.DIGEST_SIZE:
+                    return
+                yield offset, header + rest[:-self.DIGEST_SIZE], rest[-self.DIGEST_SIZE:]
+                offset += len(header) + len(rest)
+
+    def _scan_verified(self, segment: int) -> Iterator[Tuple[int, int, int, List[bytes]]]:
+        """
+        Yield (offset, end, ts_us, lookup keys) while checking each record's hash,
+        sequence and link to the previous record; raises ValueError on a mismatch
+        """
+        for offset, body, stored_hash in self._scan_segment(segment):
+            _, seq, ts_us, prev_hash, tx_hash_raw, id_len = self.RECORD_FIELDS.unpack_from(body)
+            if (seq != self._next_seq or prev_hash != self._last_hash or
+                    hashlib.sha256(body).digest() != stored_hash):
+                raise ValueError(f'Audit segment {segment} fails hash chain verification '
+                                 f'at offset {offset} (sequence {seq})')
+            keys = []
+            if tx_hash_raw != self.GENESIS_HASH:
+                keys.append(self._lookup_key(b'h', tx_hash_raw.hex()))
+            if id_len:
+                record_id = body[self.HEADER_SIZE:self.HEADER_SIZE + id_len].decode()
+                keys.append(self._lookup_key(b'i', record_id))
+            self._last_hash = stored_hash
+            self._next_seq = seq + 1
+            yield offset, offset + len(body) + self.DIGEST_SIZE, ts_us, keys
+
+    def _bloom_positions(self, keys: np.ndarray, n_bits: int) -> np.ndarray:
+        halves = np.frombuffer(keys.tobytes(), dtype='>u8').reshape(-1, 2).astype(np.uint64)
+        steps = np.arange(self.BLOOM_HASHES, dtype=np.uint64)
+        return (halves[:, :1] + steps * (halves[:, 1:] | np.uint64(1))) % np.uint64(n_bits)
+
+    def _write_array(self, path: str, array: np.ndarray) -> None:
+        with open(path + '.tmp', 'wb') as handle:
+            np.save(handle, array)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(path + '.tmp', path)
+
+    def _seal_index(self, segment: int, first_seq: int,
+                    times: List[Tuple[int, int]], keys: Dict[bytes, List[int]]) -> Dict:
+        """Persist the on-disk index of a segment and return its metadata"""
+        time_index = np.array(times, dtype=self.TIME_DTYPE)
+        time_index.sort(order=['ts', 'offset'])
+        key_index = np.array([(key, offset) for key, offsets in keys.items() for offset in offsets],
+                             dtype=self.KEY_DTYPE)
+        key_index.sort(order=['key', 'offset'])
+
+        n_bits = max(64, -(-self.BLOOM_BITS_PER_KEY * len(key_index) // 8) * 8)
+        bloom = np.zeros(n_bits, dtype=bool)
+        if len(key_index):
+            bloom[self._bloom_positions(key_index['key'], n_bits).ravel()] = True
+
+        self._write_array(self._index_path(segment, 'time.npy'), time_index)
+        self._write_array(self._index_path(segment, 'keys.npy'), key_index)
+        self._write_array(self._index_path(segment, 'bloom.npy'), np.packbits(bloom))
+
+        meta = {
+            'segment': segment,
+            'count': len(time_index),
+            'min_ts': int(time_index['ts'][0]) if len(time_index) else 0,
+            'max_ts': int(time_index['ts'][-1]) if len(time_index) else -1,
+            'first_seq': first_seq,
+            'next_seq': self._next_seq,
+            'last_hash': self._last_hash.hex()
+        }
+        # Metadata is written last: its presence marks a complete index
+        with open(self._index_path(segment, 'meta.json.tmp'), 'w') as handle:
+            json.dump(meta, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(self._index_path(segment, 'meta.json.tmp'), self._index_path(segment, 'meta.json'))
+        return meta
+
+    def _recover(self) -> None:
+        """Load sealed segment metadata and verify-rescan only the active segment"""
+        segments = sorted(
+            int(name[len('segment-'):-len('.log')])
+            for name in os.listdir(self.directory)
+            if name.startswith('segment-') and name.endswith('.log')
+        ) or [0]
+
+        for segment in segments[:-1]:
+            meta_path = self._index_path(segment, 'meta.json')
+            if os.path.exists(meta_path):
+                with open(meta_path) as handle:
+                    meta = json.load(handle)
+                self._last_hash = bytes.fromhex(meta['last_hash'])
+                self._next_seq = meta['next_seq']
+            else:
+                # Crashed while sealing: rebuild the index from the (fsynced) segment
+                first_seq, times, keys, end = self._next_seq, [], {}, 0
+                for offset, end, ts_us, record_keys in self._scan_verified(segment):
+                    times.append((ts_us, offset))
+                    for key in record_keys:
+                        keys.setdefault(key, []).append(offset)
+                if end != os.path.getsize(self._segment_path(segment)):
+                    raise ValueError(f'Sealed audit segment {segment} has trailing bytes at offset {end}')
+                meta = self._seal_index(segment, first_seq, times, keys)
+            self._sealed.append(meta)
+
+        self._active_segment = segments[-1]
+        path = self._segment_path(self._active_segment)
+        if not os.path.exists(path):
+            open(path, 'wb').close()
+        self._active_first_seq = self._next_seq
+        for offset, end, ts_us, record_keys in self._scan_verified(self._active_segment):
+            self._index_active(offset, ts_us, record_keys)
+            self._active_size = end
+
+        # Only a final record cut short by EOF is dropped; corruption raised above
+        if os.path.getsize(path) > self._active_size:
+            os.truncate(path, self._active_size)
+        self._file = open(path, 'ab')
+
+    def _index_active(self, offset: int, ts_us: int, keys: List[bytes]) -> None:
+        for key in keys:
+            self._active_keys.setdefault(key, []).append(offset)
+        entry = (ts_us, offset)
+        if not self._active_times or entry >= self._active_times[-1]:
+            self._active_times.append(entry)
+        else:
+            bisect.insort(self._active_times, entry)
+
+    def append(self, record: Dict) -> int:
+        """
+        Append a monitoring result and return its sequence number
+        Records reach the OS immediately and are fsynced by the next group
+        commit, at most group_commit_interval seconds later
+        """
+        with self._lock:
+            seq = self._next_seq
+            data, ts_us, keys = self._encode(record, seq)
+            offset = self._active_size
+
+            self._file.write(data)
+            self._file.flush()
+            self._active_size += len(data)
+            self._last_hash = data[-self.DIGEST_SIZE:]
+            self._next_seq += 1
+            self._pending += 1
+            self._index_active(offset, ts_us, keys)
+
+            if (self._pending >= self.group_commit_size or
+                    time.monotonic() - self._last_sync >= self.group_commit_interval):
+                self.sync()
+            elif self._commit_timer is None:
+                # Commit a trailing burst even if no further appends arrive
+                self._commit_timer = threading.Timer(self.group_commit_interval, self._timed_commit)
+                self._commit_timer.daemon = True
+                self._commit_timer.start()
+            if self._active_size >= self.segment_size:
+                self._roll_segment()
+            return seq
+
+    def sync(self) -> None:
+        """Flush and fsync all pending appends as one group commit"""
+        with self._lock:
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+            self._last_sync = time.monotonic()
+
+    def _timed_commit(self) -> None:
+        with self._lock:
+            self._commit_timer = None
+            if self._pending and not self._file.closed:
+                self.sync()
+
+    def _roll_segment(self) -> None:
+        """Seal the active segment and start a new one"""
+        self.sync()
+        self._file.close()
+        sealed = self._active_segment
+        self._sealed.append(self._seal_index(sealed, self._active_first_seq,
+                                             self._active_times, self._active_keys))
+
+        self._active_segment = sealed + 1
+        self._active_first_seq = self._next_seq
+        self._active_keys = {}
+        self._active_times = []
+        self._active_size = 0
+        self._file = open(self._segment_path(self._active_segment), 'ab')
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self.sync()
+                self._file.close()
+
+    def _read_records(self, segment: int, offsets) -> Iterator[Dict]:
+        """Read records of one segment through a single file handle"""
+        with open(self._segment_path(segment), 'rb') as handle:
+            for offset in offsets:
+                handle.seek(int(offset))
+                header = handle.read(self.HEADER_SIZE)
+                payload_len, _, _, _, _, id_len = self.RECORD_FIELDS.unpack_from(header)
+                yield self._decode(header + handle.read(id_len + payload_len))
+
+    def _sealed_offsets(self, segment: int, key: bytes) -> List[int]:
+        """Look a key up in a sealed segment's on-disk index"""
+        bloom = self._blooms.get(segment)
+        if bloom is None:
+            bloom = self._blooms[segment] = np.load(self._index_path(segment, 'bloom.npy'))
+        positions = self._bloom_positions(np.array([key], dtype='S16'), len(bloom) * 8)[0]
+        if not np.all((bloom[positions >> np.uint64(3)] >> (7 - (positions & np.uint64(7)))) & 1):
+            return []
+        keys = np.load(self._index_path(segment, 'keys.npy'), mmap_mode='r')
+        lo = np.searchsorted(keys['key'], key, side='left')
+        hi = np.searchsorted(keys['key'], key, side='right')
+        return sorted(int(offset) for offset in keys['offset'][lo:hi])
+
+    def _find_by_key(self, key: bytes, matches) -> List[Dict]:
+        with self._lock:
+            sealed = [meta['segment'] for meta in self._sealed]
+            active = self._active_segment
+            active_offsets = list(self._active_keys.get(key, []))
+
+        results = []
+        for segment in sealed:
+            offsets = self._sealed_offsets(segment, key)
+            if offsets:
+                results.extend(self._read_records(segment, offsets))
+        if active_offsets:
+            results.extend(self._read_records(active, active_offsets))
+        # Index keys are truncated digests; confirm against the record itself
+        return [record for record in results if matches(record)]
+
+    def find_by_transaction_hash(self, transaction_hash: str) -> List[Dict]:
+        """Return all audit records for a transaction hash"""
+        return self._find_by_key(self._lookup_key(b'h', transaction_hash),
+                                 lambda record: record.get('transaction_hash') == transaction_hash)
+
+    def find_by_transaction_id(self, transaction_id) -> List[Dict]:
+        """Return all audit records for a transaction id"""
+        transaction_id = str(transaction_id)
+        return self._find_by_key(
+            self._lookup_key(b'i', transaction_id),
+            lambda record: str(record.get('transaction_id', record.get('id'))) == transaction_id
+        )
+
+    def find_by_time_range(self, start: datetime, end: datetime) -> Iterator[Dict]:
+        """
+        Yield audit records with start <= timestamp < end
+        Records are in time order within each segment, segments in append order
+        """
+        start_us, end_us = self._to_micros(start), self._to_micros(end)
+        with self._lock:
+            sealed = list(self._sealed)
+            active = self._active_segment
+            lo = bisect.bisect_left(self._active_times, (start_us,))
+            hi = bisect.bisect_left(self._active_times, (end_us,))
+            active_offsets = [offset for _, offset in self._active_times[lo:hi]]
+
+        for meta in sealed:
+            if meta['max_ts'] < start_us or meta['min_ts'] >= end_us:
+                continue
+            times = np.load(self._index_path(meta['segment'], 'time.npy'), mmap_mode='r')
+            lo = np.searchsorted(times['ts'], start_us, side='left')
+            hi = np.searchsorted(times['ts'], end_us, side='left')
+            yield from self._read_records(meta['segment'], times['offset'][lo:hi])
+        if active_offsets:
+            yield from self._read_records(active, active_offsets)
+
+    def verify_chain(self) -> Dict:
+        """
+        Walk every segment and recompute the hash chain
+        Any modified, removed or reordered record breaks the chain
+        """
+        with self._lock:
+            self._file.flush()
+            segments = [meta['segment'] for meta in self._sealed] + [self._active_segment]
+
+        previous = self.GENESIS_HASH
+        expected_seq = 0
+        checked = 0
+        for segment in segments:
+            end = 0
+            try:
+                for offset, body, stored_hash in self._scan_segment(segment):
+                    _, seq, _, prev_hash, _, _ = self.RECORD_FIELDS.unpack_from(body)
+                    if (seq != expected_seq or prev_hash != previous or
+                            hashlib.sha256(body).digest() != stored_hash):
+                        return {'valid': False, 'records_checked': checked, 'first_invalid_sequence': seq}
+                    previous = stored_hash
+                    expected_seq += 1
+                    checked += 1
+                    end = offset + len(body) + self.DIGEST_SIZE
+            except ValueError:
+                end = -1
+            if end != os.path.getsize(self._segment_path(segment)):
+                return {'valid': False, 'records_checked': checked, 'first_invalid_sequence': expected_seq}
+
+        return {'valid': True, 'records_checked': checked, 'first_invalid_sequence': None}
+
+"""### Batch Alerting Engine
+feat(alerts): Add vectorized batch alerting for blockchain transactions
+- Evaluates value, currency, counterparty and pattern thresholds as array masks
+- Adds per-entity deduplication and rate limiting with time-bucketed state
+- Emits alerts for a whole batch at once
+"""
+
+import threading
+from typing import Tuple
+import numpy as np
+import pandas as pd
+
+class BatchAlertEngine:
+    ALERT_COLUMNS = ['transaction_index', 'transaction_id', 'entity', 'alert', 'value', 'bucket']
+    STATE_KEYS = ['entity', 'alert', 'bucket']
+
+    def __init__(self,
+                 alert_thresholds: Dict,
+                 currency_limits: Optional[Dict[str, float]] = None,
+                 counterparty_limits: Optional[Dict[str, float]] = None,
+                 bucket_seconds: int = 60,
+                 max_alerts_per_bucket: int = 1,
+                 state_retention_buckets: int = 60,
+                 alert_sink=None):
+        """
+        Parameters:
+        alert_thresholds: Global thresholds (see BlockchainMonitor.alert_thresholds)
+        currency_limits: Maximum transaction value per currency
+        counterparty_limits: Maximum transaction value per sender or receiver
+        bucket_seconds: Width of the rate limiting time bucket
+        max_alerts_per_bucket: Alerts emitted per entity and alert type in one bucket
+        state_retention_buckets: Buckets of rate limiting state kept per entity; alerts
+            for older buckets are emitted without deduplication
+        alert_sink: Optional callable receiving each batch of emitted alerts
+        """
+        self.alert_thresholds = alert_thresholds
+        self.currency_limits = currency_limits or {}
+        self.counterparty_limits = counterparty_limits or {}
+        self.bucket_seconds = bucket_seconds
+        self.max_alerts_per_bucket = max_alerts_per_bucket
+        self.state_retention_buckets = state_retention_buckets
+        self.alert_sink = alert_sink
+
+        self._lock = threading.Lock()
+        # Alerts already emitted per (entity, alert, bucket)
+        self._rate_state = pd.Series(
+            np.zeros(0, dtype=np.int64),
+            index=pd.MultiIndex.from_arrays([np.array([], dtype=object), np.array([], dtype=object),
+                                             np.array([], dtype=np.int64)], names=self.STATE_KEYS)
+        )
+        self._newest_bucket = np.iinfo(np.int64).min
+        self._rows_seen = 0
+        self.stats = {'transactions': 0, 'emitted': 0, 'suppressed': 0, 'late': 0}
+
+    @staticmethod
+    def _now() -> pd.Timestamp:
+        """Naive UTC clock, matching how timestamp columns are bucketed"""
+        return pd.Timestamp.now(tz='UTC').tz_localize(None)
+
+    def _column(self, df: pd.DataFrame, name: str, default):
+        return df[name] if name in df.columns else pd.Series(default, index=df.index)
+
+    def _limit_mask(self, values: np.ndarray, keys: pd.Series, limits: Dict[str, float]) -> np.ndarray:
+        """Compare each value against the limit mapped from its key (no limit -> inf)"""
+        mapped = keys.map(limits).to_numpy(dtype=float, na_value=np.inf)
+        return values > mapped
+
+    def evaluate(self, transactions) -> pd.DataFrame:
+        """
+        Evaluate all thresholds over a columnar batch of transactions
+
+        `transactions` is a DataFrame or a dict of equal-length columns with at
+        least `value`; `id`, `sender`, `receiver`, `currency`, `timestamp` and
+        `pattern_score` are used when present.
+        """
+        df = transactions if isinstance(transactions, pd.DataFrame) else pd.DataFrame(transactions)
+        df = df.reset_index(drop=True)
+        values = df['value'].to_numpy(dtype=float)
+
+        if 'timestamp' in df.columns:
+            stamps = pd.to_datetime(df['timestamp'], utc=True).dt.tz_localize(None)
+        else:
+            stamps = pd.Series(self._now(), index=df.index)
+        seconds = stamps.to_numpy(dtype='datetime64[s]').astype(np.int64)
+        buckets = seconds // self.bucket_seconds
+
+        # Rows without a sender are keyed by their id, or by a never-repeating row key
+        with self._lock:
+            first_row = self._rows_seen
+            self._rows_seen += len(df)
+        row_keys = 'row-' + pd.Series(np.arange(first_row, first_row + len(df)), index=df.index).astype(str)
+        transaction_ids = self._column(df, 'id', None)
+        fallback = ('transaction-' + transaction_ids.astype(str)).where(transaction_ids.notna(), row_keys)
+        senders = self._column(df, 'sender', None)
+        senders = senders.astype(str).where(senders.notna(), fallback)
+
+        checks = [('HIGH_VALUE_TRANSACTION',
+                   values > self.alert_thresholds['high_value_threshold'], senders)]
+        if self.currency_limits and 'currency' in df.columns:
+            checks.append(('CURRENCY_LIMIT_EXCEEDED',
+                           self._limit_mask(values, df['currency'], self.currency_limits), senders))
+        if self.counterparty_limits:
+            for column in ('sender', 'receiver'):
+                if column in df.columns:
+                    checks.append(('COUNTERPARTY_LIMIT_EXCEEDED',
+                                   self._limit_mask(values, df[column], self.counterparty_limits),
+                                   df[column].astype(str)))
+        if 'pattern_score' in df.columns:
+            scores = df['pattern_score'].to_numpy(dtype=float, na_value=0.0)
+            checks.append(('SUSPICIOUS_PATTERN',
+                           scores >= self.alert_thresholds['suspicious_pattern_threshold'], senders))
+
+        frames = [
+            pd.DataFrame({
+                'transaction_index': np.flatnonzero(mask),
+                'transaction_id': transaction_ids.to_numpy()[mask],
+                'entity': entities.to_numpy()[mask],
+                'alert': alert,
+                'value': values[mask],
+                'bucket': buckets[mask]
+            })
+            for alert, mask, entities in checks if mask.any()
+        ]
+        alerts = (pd.concat(frames, ignore_index=True) if frames
+                  else pd.DataFrame(columns=self.ALERT_COLUMNS))
+        # The same transaction can hit one counterparty limit as sender and receiver
+        alerts = alerts.drop_duplicates(['transaction_index', 'entity', 'alert'])
+
+        with self._lock:
+            alerts = self._rate_limit(alerts)
+            self.stats['transactions'] += len(df)
+
+        if self.alert_sink is not None and len(alerts):
+            self.alert_sink(alerts)
+        return alerts
+
+    def _rate_limit(self, alerts: pd.DataFrame) -> pd.DataFrame:
+        """
+        Keep at most max_alerts_per_bucket alerts per (entity, alert, bucket)
+
+        Alerts for buckets older than the retention window have no state left
+        to deduplicate against; they are emitted and counted as late rather
+        than dropped. The state merge is a vectorized join on the bucket key.
+        """
+        if alerts.empty:
+            return alerts.reset_index(drop=True)
+
+        # Future-dated rows must not move the window past the real clock
+        now_bucket = int(self._now().timestamp()) // self.bucket_seconds
+        plausible = alerts['bucket'].to_numpy()
+        plausible = plausible[plausible <= now_bucket + 1]
+        if len(plausible):
+            self._newest_bucket = max(self._newest_bucket, int(plausible.max()))
+        cutoff = self._newest_bucket - self.state_retention_buckets
+
+        alerts = alerts.sort_values('bucket', kind='stable')
+        grouped = alerts.groupby(self.STATE_KEYS, sort=False, dropna=False)
+        rank = grouped.cumcount().to_numpy()
+        group_of_row = grouped.ngroup().to_numpy()
+        sizes = grouped.size()
+
+        prior = self._rate_state.reindex(sizes.index, fill_value=0).to_numpy()
+        in_window = sizes.index.get_level_values('bucket').to_numpy() >= cutoff
+        row_in_window = in_window[group_of_row]
+        allowed = ~row_in_window | (prior[group_of_row] + rank < self.max_alerts_per_bucket)
+
+        updated = pd.Series(np.minimum(self.max_alerts_per_bucket, prior + sizes.to_numpy()),
+                            index=sizes.index)[in_window]
+        state = self._rate_state
+        self._rate_state = pd.concat([state[~state.index.isin(updated.index)], updated])
+        self._prune_state(cutoff)
+
+        self.stats['emitted'] += int(allowed.sum())
+        self.stats['suppressed'] += int((~allowed).sum())
+        self.stats['late'] += int((~row_in_window).sum())
+        return alerts[allowed].sort_values('transaction_index', kind='stable').reset_index(drop=True)
+
+    def _prune_state(self, cutoff: int) -> None:
+        """Drop rate limiting buckets older than the retention window"""
+        buckets = self._rate_state.index.get_level_values('bucket')
+        if len(buckets) and buckets.min() < cutoff:
+            self._rate_state = self._rate_state[buckets >= cutoff]
+
+# Example: a batch without sender or id columns still alerts once per transaction
+sample_batch_alerts = BatchAlertEngine(blockchain_monitor.alert_thresholds).evaluate(
+    {'value': [2000000, 3000000, 4000000]}
+)
+print("Batch alerts emitted:", len(sample_batch_alerts))
+
+"""### Out-of-Core Risk Model Training
+feat(training): Add sharded out-of-core training pipeline for risk models
+- Streams features from Parquet or memory-mapped .npy shards
+- Fits the scaler in a single streaming pass
+- Trains sub-forests on shards in parallel and merges them into one forest
+- Adds wall time and peak memory benchmark against in-memory training
+"""
+
+import glob
+import os
+import time
+import tracemalloc
+from typing import Iterator, Tuple, Union
+from joblib import Parallel, delayed, effective_n_jobs
+
+Shard = Union[str, Tuple[str, str]]  # Parquet path, or (features .npy, labels .npy)
+
+class ShardedTrainingPipeline:
+    """
+    Out-of-core training of an AIRiskPredictor forest from feature shards
+
+    Every shard contributes at least one tree, so n_estimators must be at least
+    the number of shards. A shard may lack some classes (common for rare fraud
+    labels): its trees are fitted on the classes it has and aligned to the
+    global classes, giving the missing ones zero probability. A class must
+    therefore appear in enough shards for the merged forest to learn it.
+    """
+
+    def __init__(self,
+                 shards: List[Shard],
+                 label_column: str = 'label',
+                 n_estimators: int = 100,
+                 n_jobs: int = -1,
+                 batch_size: int = 100_000,
+                 random_state: Optional[int] = None):
+        """
+        Parameters:
+        shards: Parquet files (features plus label_column) or (X.npy, y.npy) pairs
+        label_column: Name of the label column in Parquet shards
+        n_estimators: Total number of trees, split across shards
+        n_jobs: Cores to use (-1 for all); split between shards and, when there
+            are fewer shards than cores, the trees within each shard
+        batch_size: Rows per chunk in the streaming scaler pass
+        """
+        self.shards = shards
+        self.label_column = label_column
+        self.n_estimators = n_estimators
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
+        self.random_state = random_state
+
+    @staticmethod
+    def discover_shards(directory: str) -> List[Shard]:
+        """Find *.parquet shards and X_<name>.npy / y_<name>.npy pairs in a directory"""
+        shards: List[Shard] = sorted(glob.glob(os.path.join(directory, '*.parquet')))
+        for features_path in sorted(glob.glob(os.path.join(directory, 'X_*.npy'))):
+            name = os.path.basename(features_path)[len('X_'):]
+            labels_path = os.path.join(directory, 'y_' + name)
+            if os.path.exists(labels_path):
+                shards.append((features_path, labels_path))
+        return shards
+
+    def _iter_batches(self, shard: Shard) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Yield (X, y) chunks of a shard without loading it whole"""
+        if isinstance(shard, str):
+            import pyarrow.parquet as pq
+            for batch in pq.ParquetFile(shard).iter_batches(batch_size=self.batch_size):
+                frame = batch.to_pandas()
+                yield (frame.drop(columns=[self.label_column]).to_numpy(dtype=np.float64),
+                       frame[self.label_column].to_numpy())
+        else:
+            X = np.load(shard[0], mmap_mode='r')
+            y = np.load(shard[1], mmap_mode='r')
+            for start in range(0, len(X), self.batch_size):
+                yield (np.asarray(X[start:start + self.batch_size], dtype=np.float64),
+                       np.asarray(y[start:start + self.batch_size]))
+
+    def _load_shard(self, shard: Shard) -> Tuple[np.ndarray, np.ndarray]:
+        if isinstance(shard, str):
+            import pyarrow.parquet as pq
+            frame = pq.read_table(shard).to_pandas()
+            return (frame.drop(columns=[self.label_column]).to_numpy(dtype=np.float64),
+                    frame[self.label_column].to_numpy())
+        return np.load(shard[0], mmap_mode='r'), np.load(shard[1], mmap_mode='r')
+
+    def fit_scaler(self) -> Tuple[StandardScaler, np.ndarray]:
+        """Fit the scaler in one streaming pass; also collects the label classes"""
+        scaler = StandardScaler()
+        classes = None
+        for shard in self.shards:
+            for X, y in self._iter_batches(shard):
+                scaler.partial_fit(X)
+                labels = np.unique(y)
+                classes = labels if classes is None else np.union1d(classes, labels)
+        return scaler, classes
+
+    @staticmethod
+    def _align_classes(forest: RandomForestClassifier, classes: np.ndarray) -> None:
+        """Widen every tree's class outputs from the shard's classes to `classes`"""
+        from sklearn.tree._tree import Tree
+
+        if np.array_equal(forest.classes_, classes):
+            return
+        columns = np.searchsorted(classes, forest.classes_)
+        for tree in forest.estimators_:
+            state = tree.tree_.__getstate__()
+            values = np.zeros(state['values'].shape[:2] + (len(classes),))
+            values[:, :, columns] = state['values']
+            state['values'] = values
+            aligned = Tree(tree.n_features_in_, np.array([len(classes)], dtype=np.intp), 1)
+            aligned.__setstate__(state)
+            tree.tree_ = aligned
+            tree.classes_ = classes
+            tree.n_classes_ = len(classes)
+        forest.classes_ = classes
+        forest.n_classes_ = len(classes)
+
+    def _fit_sub_forest(self, shard: Shard, scaler: StandardScaler, n_trees: int,
+                        classes: np.ndarray, seed: Optional[int], n_jobs: int) -> RandomForestClassifier:
+        X, y = self._load_shard(shard)
+        forest = RandomForestClassifier(n_estimators=n_trees, random_state=seed, n_jobs=n_jobs)
+        forest.fit(scaler.transform(X), y)
+        self._align_classes(forest, classes)
+        return forest
+
+    def train(self, predictor: Optional[AIRiskPredictor] = None) -> AIRiskPredictor:
+        """
+        Train one forest from all shards and hot swap it into the predictor
+
+        Each shard is loaded by a single worker and fits its share of the trees;
+        tree fitting releases the GIL, so thread workers run on separate cores.
+        At most one shard per core is resident at a time, and cores left over
+        when there are fewer shards than cores fit trees within each shard.
+        """
+        if not self.shards:
+            raise ValueError('No shards to train on')
+        n_shards = len(self.shards)
+        if self.n_estimators < n_shards:
+            raise ValueError(f'n_estimators ({self.n_estimators}) must be at least the number '
+                             f'of shards ({n_shards}) so that every shard is used')
+        predictor = predictor or AIRiskPredictor()
+        scaler, classes = self.fit_scaler()
+
+        cores = effective_n_jobs(self.n_jobs)
+        shard_workers = min(cores, n_shards)
+        trees_per_shard = [self.n_estimators // n_shards + (i < self.n_estimators % n_shards)
+                           for i in range(n_shards)]
+        seeds = (np.random.RandomState(self.random_state)
+                 .randint(np.iinfo(np.int32).max, size=n_shards))
+
+        sub_forests = Parallel(n_jobs=shard_workers, prefer='threads')(
+            delayed(self._fit_sub_forest)(shard, scaler, n_trees, classes, seed,
+                                          max(1, cores // shard_workers))
+            for shard, n_trees, seed in zip(self.shards, trees_per_shard, seeds)
+        )
+
+        forest = sub_forests[0]
+        forest.estimators_ = [tree for sub_forest in sub_forests for tree in sub_forest.estimators_]
+        forest.n_estimators = len(forest.estimators_)
+        predictor.publish_model(scaler, forest)
+        return predictor
+
+def benchmark_sharded_training(directory: str,
+                               n_samples: int = 200_000,
+                               n_features: int = 20,
+                               n_shards: int = 8,
+                               n_jobs: int = -1) -> Dict:
+    """
+    Compare wall time, peak traced memory and accuracy of sharded vs in-memory training
+
+    The two models differ: each sharded tree is fitted on 1/n_shards of the
+    rows, while the in-memory forest fits every tree on all rows. Much of the
+    time gap therefore comes from less data per tree, so held-out accuracy is
+    reported alongside. Writes synthetic .npy shards to `directory`. Peak
+    memory is measured with tracemalloc, which covers numpy buffers but not
+    memory-mapped pages.
+    """
+    from sklearn.datasets import make_classification
+
+    n_test = n_samples // 5
+    X, y = make_classification(n_samples=n_samples + n_test, n_features=n_features,
+                               n_informative=n_features // 2, n_classes=3, random_state=0)
+    X_test, y_test = X[n_samples:], y[n_samples:]
+    X, y = X[:n_samples], y[:n_samples]
+    os.makedirs(directory, exist_ok=True)
+    for i, (X_shard, y_shard) in enumerate(zip(np.array_split(X, n_shards), np.array_split(y, n_shards))):
+        np.save(os.path.join(directory, f'X_{i:04d}.npy'), X_shard)
+        np.save(os.path.join(directory, f'y_{i:04d}.npy'), y_shard)
+    del X, y
+
+    results = {}
+    shards = ShardedTrainingPipeline.discover_shards(directory)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    sharded = ShardedTrainingPipeline(shards, n_jobs=n_jobs).train()
+    results['sharded_seconds'] = time.perf_counter() - start
+    results['sharded_peak_mb'] = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    results['sharded_accuracy'] = float(np.mean(sharded.predict_risk(X_test).argmax(axis=1) == y_test))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    X_all = np.concatenate([np.load(features_path) for features_path, _ in shards])
+    y_all = np.concatenate([np.load(labels_path) for _, labels_path in shards])
+    in_memory = AIRiskPredictor()
+    in_memory.train_model(X_all, y_all)
+    results['in_memory_seconds'] = time.perf_counter() - start
+    results['in_memory_peak_mb'] = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    results['in_memory_accuracy'] = float(np.mean(in_memory.predict_risk(X_test).argmax(axis=1) == y_test))
+
+    return results
+
+"""### Transaction Result Cache
+feat(cache): Add shared result cache for repeated transaction scoring
+- Caches risk results by canonical transaction hash
+- Adds bounded LRU storage with TTL eviction
+- Shared by BlockchainMonitor and the risk assessment API
+- Exposes hit, miss and eviction statistics
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+class TransactionResultCache:
+    def __init__(self, maxsize: int = 100_000, ttl: float = 300.0):
+        """
+        Parameters:
+        maxsize: Maximum number of cached results; least recently used are evicted
+        ttl: Seconds a result stays valid after it was stored
+
+        The cache is cleared when AIRiskPredictor swaps in a new model; after
+        other scoring changes (e.g. alert thresholds) call clear(), or results
+        can be stale for up to ttl seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()  # (scope, key) -> (expires_at, value)
+        # Critical sections never await, so a thread lock is safe from async tasks too
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+    def get(self, key: str, scope: Hashable = 'default') -> Optional[Any]:
+        """Return the cached result for a transaction hash, or None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((scope, key))
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            if entry[0] <= now:
+                del self._entries[(scope, key)]
+                self.stats['expirations'] += 1
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end((scope, key))
+            self.stats['hits'] += 1
+            return entry[1]
+
+    def put(self, key: str, value: Any, scope: Hashable = 'default') -> None:
+        """Store a result under a transaction hash"""
+        now = time.monotonic()
+        with self._lock:
+            self._entries[(scope, key)] = (now + self.ttl, value)
+            self._entries.move_to_end((scope, key))
+
+            # Expired entries at the cold end go first, then capacity evictions
+            while self._entries:
+                expires_at, _ = next(iter(self._entries.values()))
+                if expires_at > now:
+                    break
+                self._entries.popitem(last=False)
+                self.stats['expirations'] += 1
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Snapshot of cache statistics"""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                **self.stats,
+                'size': len(self._entries),
+                'hit_rate': self.stats['hits'] / lookups if lookups else 0.0
+            }
+
+# Shared between the blockchain monitor and the /api/v1/risk-assessment endpoint
+risk_result_cache = TransactionResultCache()
+blockchain_monitor.result_cache = risk_result_cache
+risk_predictor.result_cache = risk_result_cache
+
+@app.get("/api/v1/cache-stats")
+async def get_cache_stats(token: str = Security(oauth2_scheme)) -> Dict:
+    """
+    Hit, miss and eviction statistics of the shared result cache
+    """
+    return risk_result_cache.get_stats()
+
 """##conclusion:
 ###Research Implementation Results
 